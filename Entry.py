@@ -1,5 +1,7 @@
 import streamlit as st
-from utils import render_footer
+from utils import render_footer, start_background_services
+
+start_background_services()
 
 # Keep just the CSS and title
 st.markdown(
@@ -0,0 +1,285 @@
+"""Read-only JSON API over the app's cached datasets.
+
+Serves the same standings, playoff odds, live scoreboard and player stats the
+pages show, straight from the cache layer in utils, so other dashboards don't
+have to scrape the UI or call nba_api themselves.
+
+    GET /standings[?conference=Eastern]
+    GET /odds[?conference=Eastern&win_probability=0.5]
+    GET /scoreboard
+    GET /players[?season=2024-25&team=1610612747]
+
+Every list endpoint takes ``page`` (1-based) and ``per_page`` (max 500).
+Responses carry an ETag; a request with a matching If-None-Match gets an
+empty 304. Bodies are gzipped when the client sends Accept-Encoding: gzip.
+
+Run it next to the app by setting ``NBA_API_PORT`` (the first page load
+starts it in the Streamlit server process), or on its own:
+
+    python api_server.py --port 8502
+
+With several replicas on one host only the first to bind the port serves the
+API; the others log a warning and carry on without it.
+"""
+import argparse
+import asyncio
+import functools
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+import streamlit as st
+
+import nba_data
+import utils
+from playoffs import calculate_playoff_odds
+
+logger = logging.getLogger(__name__)
+
+MAX_PER_PAGE = 500
+DEFAULT_PER_PAGE = 100
+CONFERENCES = ('Eastern', 'Western')
+SEASON_PATTERN = re.compile(r'^(\d{4})-(\d{2})$')
+# The all-time leaders season label. (SeasonAll.default, which the player
+# stats page offers, is the current season string and matches the pattern.)
+ALL_TIME = 'All Time'
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _records(df):
+    # Round-trip through pandas' JSON writer so numpy scalars and NaN serialize cleanly
+    return json.loads(df.to_json(orient='records'))
+
+
+def validate_params(params):
+    """Parse and check query parameters before anything touches the loaders.
+
+    Returns a new dict with typed values; raises HTTPError(400) on bad input so
+    only genuine client mistakes are reported as Bad Request.
+    """
+    parsed = dict(params)
+
+    conference = params.get('conference')
+    if conference is not None and conference not in CONFERENCES:
+        raise HTTPError(400, f"conference must be one of {', '.join(CONFERENCES)}")
+
+    if 'win_probability' in params:
+        try:
+            win_probability = float(params['win_probability'])
+        except ValueError:
+            raise HTTPError(400, "win_probability must be a number")
+        # Also rejects nan, which would otherwise end up as invalid JSON
+        if not 0.0 <= win_probability <= 1.0:
+            raise HTTPError(400, "win_probability must be between 0 and 1")
+        parsed['win_probability'] = win_probability
+
+    if 'season' in params:
+        # Season strings go upstream and become cache keys (and shared store files)
+        match = SEASON_PATTERN.match(params['season'])
+        if params['season'] != ALL_TIME and (not match or (int(match[1]) + 1) % 100 != int(match[2])):
+            raise HTTPError(400, f"season must look like 2023-24 or be {ALL_TIME!r}")
+
+    for name in ('team', 'page', 'per_page'):
+        if name in params:
+            try:
+                parsed[name] = int(params[name])
+            except ValueError:
+                raise HTTPError(400, f"{name} must be an integer")
+    return parsed
+
+
+def _conference(df, params):
+    conference = params.get('conference')
+    return df[df['Conference'] == conference] if conference else df
+
+
+def standings(params):
+    return _records(_conference(utils.get_current_standings(), params))
+
+
+def odds(params):
+    df = _conference(utils.get_current_standings(), params)
+    win_probability = params.get('win_probability')
+    rows = []
+    for team in df.to_dict('records'):
+        remaining = nba_data.remaining_games(team['WINS'], team['LOSSES'])
+        p = win_probability if win_probability is not None else team['WinPCT']
+        rows.append({
+            'TeamID': team['TeamID'],
+            'Team': f"{team['TeamCity']} {team['TeamName']}",
+            'Conference': team['Conference'],
+            'WINS': team['WINS'],
+            'LOSSES': team['LOSSES'],
+            'RemainingGames': remaining,
+            'WinProbability': p,
+            'PlayoffOdds': calculate_playoff_odds(team['WINS'], team['LOSSES'], remaining, p),
+        })
+    return rows
+
+
+def scoreboard(params):
+    return utils.get_live_scoreboard()
+
+
+def players(params):
+    df = nba_data.add_per_game_stats(utils.fetch_nba_data(params.get('season', nba_data.current_season())))
+    team = params.get('team')
+    if team is not None:
+        df = df[df['TEAM_ID'] == team]
+    return _records(df[['PLAYER_ID', 'PLAYER', 'TEAM_ID', 'TEAM', 'GP', 'PTS', 'REB', 'AST', 'PPG', 'RPG', 'APG']])
+
+
+ROUTES = {
+    '/standings': standings,
+    '/odds': odds,
+    '/scoreboard': scoreboard,
+    '/players': players,
+}
+
+
+def paginate(rows, params):
+    page = max(params.get('page', 1), 1)
+    per_page = min(max(params.get('per_page', DEFAULT_PER_PAGE), 1), MAX_PER_PAGE)
+    start = (page - 1) * per_page
+    return {
+        'page': page,
+        'per_page': per_page,
+        'total': len(rows),
+        'data': rows[start:start + per_page],
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _gzip(body):
+    # Polling clients mostly get the same body back; compress it once
+    return gzip.compress(body)
+
+
+def build_response(path, params, headers):
+    """Return (status, headers, body) for a GET request."""
+    handler = ROUTES.get(path)
+    if handler is None:
+        raise HTTPError(404, f"unknown endpoint {path}")
+    params = validate_params(params)
+    try:
+        rows = handler(params)
+    except (OSError, json.JSONDecodeError):
+        # requests' errors are OSErrors; a throttled stats.nba.com answers with non-JSON
+        logger.exception("Upstream NBA stats request failed for %s", path)
+        raise HTTPError(502, "upstream NBA stats service unavailable")
+    # numpy scalars (e.g. from standings rows) serialize via .item()
+    body = json.dumps(paginate(rows, params), separators=(',', ':'), default=lambda value: value.item()).encode()
+    digest = hashlib.sha1(body).hexdigest()
+    gzipped = 'gzip' in headers.get('accept-encoding', '')
+    # Each content coding is a different representation and needs its own
+    # strong validator, or a cache could answer a 304 with the wrong encoding
+    etag = f'"{digest}-gzip"' if gzipped else f'"{digest}"'
+    response_headers = {
+        'Content-Type': 'application/json',
+        'ETag': etag,
+        'Cache-Control': 'no-cache',
+        'Vary': 'Accept-Encoding',
+    }
+    if etag in {tag.strip() for tag in headers.get('if-none-match', '').split(',')}:
+        return 304, response_headers, b''
+    if gzipped:
+        body = _gzip(body)
+        response_headers['Content-Encoding'] = 'gzip'
+    return 200, response_headers, body
+
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 500: 'Internal Server Error', 502: 'Bad Gateway'}
+
+
+async def handle(reader, writer):
+    try:
+        request_line = (await reader.readline()).decode('latin-1').split()
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        if len(request_line) < 2:
+            return
+
+        method, target = request_line[0], request_line[1]
+        url = urlsplit(target)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            if method not in ('GET', 'HEAD'):
+                raise HTTPError(405, f"{method} not allowed")
+            # The loaders block on nba_api; keep them off the event loop
+            loop = asyncio.get_running_loop()
+            status, response_headers, body = await loop.run_in_executor(
+                None, build_response, url.path, params, headers
+            )
+        except HTTPError as e:
+            status, response_headers = e.status, {'Content-Type': 'application/json'}
+            body = json.dumps({'error': e.message}).encode()
+        except Exception as e:
+            logger.exception("API request failed: %s", target)
+            status, response_headers = 500, {'Content-Type': 'application/json'}
+            body = json.dumps({'error': str(e)}).encode()
+
+        response_headers['Content-Length'] = str(len(body))
+        response_headers['Connection'] = 'close'
+        head = f"HTTP/1.1 {status} {REASONS[status]}\r\n" + ''.join(
+            f"{name}: {value}\r\n" for name, value in response_headers.items()
+        ) + "\r\n"
+        writer.write(head.encode('latin-1') + (b'' if method == 'HEAD' else body))
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(host='0.0.0.0', port=8502):
+    try:
+        server = await asyncio.start_server(handle, host, port)
+    except OSError as e:
+        # Several replicas on one host share NBA_API_PORT; only the first binds
+        logger.warning("NBA API not started on %s:%s (%s); another process is probably serving it", host, port, e)
+        return
+    logger.info("NBA API listening on %s:%s", host, port)
+    async with server:
+        await server.serve_forever()
+
+
+@st.cache_resource
+def start_api_server():
+    """Start the API in a background thread of the Streamlit server if NBA_API_PORT is set."""
+    port = os.getenv('NBA_API_PORT')
+    if not port:
+        return None
+    thread = threading.Thread(
+        target=asyncio.run, args=(serve(os.getenv('NBA_API_HOST', '0.0.0.0'), int(port)),),
+        name='nba-api-server', daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8502)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Headless batch export of standings, playoff odds and player stats.
+
+Runs the same loaders and odds logic as the Streamlit pages without a browser,
+e.g. from a nightly cron job:
+
+    python batch.py --out reports/
+    python batch.py --season 2023-24 --format json --workers 4 --win-probability 0.5
+
+Writes standings, playoff_odds and player_stats_<season> files to ``--out``.
+Per-team odds and the season stats download are spread across a process
+pool.
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+import nba_data
+from playoffs import PLAYOFF_THRESHOLD, calculate_playoff_odds
+
+
+def team_playoff_odds(team, win_probability=None, playoff_threshold=PLAYOFF_THRESHOLD):
+    """Playoff odds for one standings row (a dict); runs in a worker process."""
+    remaining = nba_data.remaining_games(team['WINS'], team['LOSSES'])
+    if win_probability is None:
+        win_probability = team['WinPCT']
+    odds = calculate_playoff_odds(team['WINS'], team['LOSSES'], remaining, win_probability, playoff_threshold)
+    return {
+        'TeamID': team['TeamID'],
+        'Team': f"{team['TeamCity']} {team['TeamName']}",
+        'Conference': team['Conference'],
+        'WINS': team['WINS'],
+        'LOSSES': team['LOSSES'],
+        'RemainingGames': remaining,
+        'WinProbability': win_probability,
+        'PlayoffOdds': odds,
+    }
+
+
+def player_stats(season):
+    df = nba_data.add_per_game_stats(nba_data.download_nba_data(season))
+    return df[['PLAYER_ID', 'PLAYER', 'TEAM_ID', 'TEAM', 'GP', 'PTS', 'REB', 'AST', 'PPG', 'RPG', 'APG']]
+
+
+def export(df, out_dir, name, fmt):
+    path = Path(out_dir) / f"{name}.{fmt}"
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_json(path, orient='records', indent=2)
+    return path
+
+
+def run(season, out_dir, fmt='parquet', workers=None, win_probability=None):
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    standings = nba_data.download_current_standings()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        stats_future = pool.submit(player_stats, season)
+        odds = list(pool.map(
+            team_playoff_odds,
+            standings.to_dict('records'),
+            [win_probability] * len(standings),
+        ))
+        stats = stats_future.result()
+
+    odds = pd.DataFrame(odds).sort_values(['Conference', 'PlayoffOdds'], ascending=[True, False])
+    return [
+        export(standings, out_dir, 'standings', fmt),
+        export(odds, out_dir, 'playoff_odds', fmt),
+        export(stats, out_dir, f"player_stats_{season}", fmt),
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--season', default=nba_data.current_season(), help="season for player stats, e.g. 2024-25")
+    parser.add_argument('--out', default='reports', help="output directory")
+    parser.add_argument('--format', choices=['parquet', 'json'], default='parquet')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="process pool size")
+    parser.add_argument('--win-probability', type=float, default=None,
+                        help="win probability for remaining games (default: each team's current win %%)")
+    args = parser.parse_args(argv)
+
+    for path in run(args.season, args.out, args.format, args.workers, args.win_probability):
+        print(path)
+
+
+if __name__ == '__main__':
+    main()
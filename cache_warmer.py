@@ -0,0 +1,150 @@
+"""Background cache warming shared by every session in the server process.
+
+The warmer refreshes the cached datasets in utils on a fixed interval, ahead
+of their TTL. Each refresh loads the *next* generation of a dataset and only
+publishes it once it is fully loaded, so readers keep getting the previous
+generation in the meantime and never block on upstream latency.
+
+When several refreshes are due at once they run in order of how often
+sessions have read the dataset (see ``utils.access_counts``).
+
+Intervals are in seconds and can be overridden with environment variables:
+
+    NBA_WARM_STANDINGS      league standings                 (default 1800)
+    NBA_WARM_SCOREBOARD     live scoreboard, folded into the
+                            standings as games finish        (default 60)
+    NBA_WARM_LEADERS        current season's league leaders  (default 3600)
+    NBA_WARM_STATIC         static team and player lists     (default 86400)
+
+With the host-level store enabled (see shared_store.py), standings and
+leaders are refreshed there instead, and a replica skips the download when
+another replica on the host published a copy within the interval.
+
+Set ``NBA_CACHE_WARMER=0`` to disable the warmer entirely.
+"""
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+import nba_data
+import utils
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVALS = {
+    "standings": 1800,
+    "scoreboard": 60,
+    "leaders": 3600,
+    "static": 86400,
+}
+
+
+def intervals_from_env():
+    return {
+        name: float(os.getenv(f"NBA_WARM_{name.upper()}", default))
+        for name, default in DEFAULT_INTERVALS.items()
+    }
+
+
+class CacheWarmer:
+    def __init__(self, intervals=None, tick=5.0):
+        self.intervals = {**DEFAULT_INTERVALS, **(intervals or {})}
+        self.tick = tick
+        self._next_run = {}
+        self._warmed = set()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def jobs(self):
+        """Return (key, interval, loader, args) for every dataset to keep warm."""
+        if utils.SHARED_STORE is None:
+            standings_loader = utils._load_current_standings
+        else:
+            # Served from the host-level store rather than st.cache_data
+            standings_loader = self._shared_refresh(
+                "standings", nba_data.download_current_standings, self.intervals["standings"]
+            )
+        jobs = [
+            ("standings", self.intervals["standings"], standings_loader, ()),
+            ("scoreboard", self.intervals["scoreboard"], utils.refresh_scoreboard, ()),
+            ("teams", self.intervals["static"], utils._fetch_teams, ()),
+            ("players", self.intervals["static"], utils._fetch_players, ()),
+        ]
+
+        # Only the season in progress changes; finished seasons and All Time
+        # are loaded once on first read and never refreshed
+        season = nba_data.current_season()
+        key = f"leaders:{season}"
+        if utils.SHARED_STORE is None:
+            loader = utils._fetch_nba_data
+        else:
+            loader = self._shared_refresh(key, utils.download_nba_data, self.intervals["leaders"])
+        jobs.append((key, self.intervals["leaders"], loader, (season,)))
+        return jobs
+
+    def _shared_refresh(self, key, download, interval):
+        """Loader that refreshes ``key`` in the shared store, at most once per
+        interval across all processes on the host."""
+
+        def loader(*args):
+            *args, _generation = args
+            utils.SHARED_STORE.refresh(key, download, *args, max_age=interval)
+
+        return loader
+
+    def due_jobs(self, now=None):
+        now = time.monotonic() if now is None else now
+        counts = utils.access_counts()
+        due = [job for job in self.jobs() if self._next_run.get(job[0], 0) <= now]
+        return sorted(due, key=lambda job: counts.get(job[0], 0), reverse=True)
+
+    def refresh(self, key, interval, loader, args):
+        # The first run fills the generation readers already use; later runs
+        # build the next generation and swap it in once it is ready.
+        generation = utils.peek_generation(key)
+        if key in self._warmed:
+            generation += 1
+        try:
+            loader(*args, generation)
+        except Exception:
+            logger.exception("Cache warming failed for %s", key)
+            # Try again sooner than a full interval, but don't hammer the API
+            self._next_run[key] = time.monotonic() + min(interval, 300)
+            return
+        utils.publish_generation(key, generation)
+        self._warmed.add(key)
+        self._next_run[key] = time.monotonic() + interval
+
+    def run_pending(self):
+        for job in self.due_jobs():
+            if self._stop.is_set():
+                return
+            self.refresh(*job)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.run_pending()
+            self._stop.wait(self.tick)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="nba-cache-warmer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+@st.cache_resource
+def start_cache_warmer():
+    """Start the process-wide warmer once; later calls return the same instance."""
+    if os.getenv("NBA_CACHE_WARMER", "1") == "0":
+        return None
+    return CacheWarmer(intervals_from_env()).start()
@@ -0,0 +1,345 @@
+"""Isolated-session load test for the Streamlit pages.
+
+Drives the real page scripts headlessly with Streamlit's AppTest framework.
+Many simulated sessions run at once, each in its own process (AppTest keeps
+global runtime state, so sessions can't share one), doing the widget
+interactions a user would: switching seasons and teams, toggling the
+conference, dragging the win probability slider. The nba_api loaders are
+swapped for generated offline fixtures, so runs are repeatable and never
+touch the network.
+
+Because every session has its own interpreter, there is no shared GIL,
+st.cache_data or script runner between them: the numbers show per-session
+script cost and what N sessions cost the host in total, not how reruns
+queue up inside one ``streamlit run`` server. Don't read them as the
+capacity of a single server process.
+
+For each session count it reports per-interaction latency percentiles,
+overall throughput and the total RSS of all session processes (and how much
+of it they grew by while running). An interaction counts as an error if the
+script raised or rendered an st.error (other than the playoff page's "uphill
+battle" verdict).
+
+    python loadtest.py
+    python loadtest.py --sessions 1 4 16 32 --iterations 5 --json results.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent
+SEASONS = ['2023-24', '2022-23', '2021-22', '2020-21', '2019-20']
+FIRST_TEAM_ID = 1610612737
+DIVISIONS = ['Atlantic', 'Central', 'Southeast', 'Northwest', 'Pacific', 'Southwest']
+
+
+# --- offline fixtures ------------------------------------------------------
+
+def _record(rng, games):
+    wins = int(rng.integers(0, games + 1))
+    return f"{wins}-{games - wins}"
+
+
+def fixture_raw_standings(seed=0):
+    """A LeagueStandings-shaped frame for 30 teams, 50 games into the season."""
+    rng = np.random.default_rng(seed)
+    months = {'Oct': 4, 'Nov': 14, 'Dec': 14, 'Jan': 14, 'Feb': 4}
+    rows = []
+    for i in range(30):
+        row = {
+            'TeamID': FIRST_TEAM_ID + i,
+            'TeamCity': f"City{i}",
+            'TeamName': f"Team{i}",
+            'Conference': 'East' if i < 15 else 'West',
+            'Division': DIVISIONS[i // 5],
+            'PlayoffRank': i % 15 + 1,
+        }
+        row.update({month: _record(rng, games) for month, games in months.items()})
+        wins = sum(int(row[month].split('-')[0]) for month in months)
+        losses = sum(months.values()) - wins
+        row.update({
+            'WINS': wins,
+            'LOSSES': losses,
+            'WinPCT': wins / (wins + losses),
+            'Record': f"{wins}-{losses}",
+            'HOME': _record(rng, 25),
+            'ROAD': _record(rng, 25),
+            'L10': _record(rng, 10),
+            'ConferenceRecord': _record(rng, 30),
+            'DivisionRecord': _record(rng, 10),
+            'PreAS': f"{wins}-{losses}",
+            'PostAS': '0-0',
+            'strCurrentStreak': f"{rng.choice(['W', 'L'])} {int(rng.integers(1, 6))}",
+        })
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def fixture_teams():
+    return pd.DataFrame([
+        {'id': FIRST_TEAM_ID + i, 'full_name': f"City{i} Team{i}", 'abbreviation': f"T{i:02d}",
+         'nickname': f"Team{i}", 'city': f"City{i}", 'state': '', 'year_founded': 1970}
+        for i in range(30)
+    ])
+
+
+def fixture_players(count=500):
+    return pd.DataFrame([
+        {'id': 1000 + i, 'full_name': f"Player {i}", 'first_name': 'Player', 'last_name': str(i),
+         'is_active': True}
+        for i in range(count)
+    ])
+
+
+def fixture_league_leaders(season, players_df=None):
+    rng = np.random.default_rng(zlib.crc32(season.encode()))
+    players_df = fixture_players() if players_df is None else players_df
+    games = rng.integers(10, 82, len(players_df))
+    team_index = rng.integers(0, 30, len(players_df))
+    df = pd.DataFrame({
+        'PLAYER_ID': players_df['id'],
+        'PLAYER': players_df['full_name'],
+        'TEAM_ID': FIRST_TEAM_ID + team_index,
+        'TEAM': [f"T{i:02d}" for i in team_index],
+        'GP': games,
+        'PTS': (games * rng.uniform(2, 30, len(players_df))).round(),
+        'REB': (games * rng.uniform(1, 12, len(players_df))).round(),
+        'AST': (games * rng.uniform(0, 10, len(players_df))).round(),
+    })
+    return df.merge(players_df[['id', 'full_name']], left_on='PLAYER_ID', right_on='id', how='left')
+
+
+def fixture_scoreboard():
+    def team(i):
+        return {'teamId': FIRST_TEAM_ID + i, 'teamCity': f"City{i}", 'teamName': f"Team{i}",
+                'score': 100 + i, 'wins': 25, 'losses': 25}
+
+    leaders = {'name': 'Player 1', 'points': 30, 'rebounds': 10, 'assists': 5}
+    return [
+        {'gameId': str(i), 'gameStatus': status, 'gameStatusText': text, 'period': 3 if status == 2 else 0,
+         'gameClock': 'PT05M00.00S' if status == 2 else '', 'awayTeam': team(2 * i), 'homeTeam': team(2 * i + 1),
+         'gameLeaders': {'homeLeaders': leaders, 'awayLeaders': leaders}}
+        for i, (status, text) in enumerate([(1, '7:30 pm ET'), (2, 'Q3 5:00'), (3, 'Final')])
+    ]
+
+
+def offline_patches():
+    """Patch the nba_api-backed loaders in nba_data with fixtures."""
+    import nba_data
+    from standings import parse_standings
+
+    return [
+        mock.patch.object(nba_data, 'download_current_standings', lambda: parse_standings(fixture_raw_standings())),
+        mock.patch.object(nba_data, 'download_nba_data', fixture_league_leaders),
+        mock.patch.object(nba_data, 'download_teams', fixture_teams),
+        mock.patch.object(nba_data, 'download_players', fixture_players),
+        mock.patch.object(nba_data, 'download_scoreboard', fixture_scoreboard),
+    ]
+
+
+# --- simulated sessions ----------------------------------------------------
+
+def _widget(at, kind, label):
+    return next(w for w in getattr(at, kind) if w.label == label)
+
+
+def scenario_entry(at, rng, timed):
+    timed('entry:load', at.run)
+
+
+def scenario_live_games(at, rng, timed):
+    timed('live:load', at.run)
+    if at.button:
+        timed('live:refresh', lambda: at.button[0].click().run())
+
+
+def scenario_player_stats(at, rng, timed):
+    timed('players:load', at.run)
+    season = rng.choice(SEASONS)
+    timed('players:season', lambda: _widget(at, 'selectbox', "Select Season").set_value(season).run())
+    team = rng.choice(_widget(at, 'selectbox', "Select Team").options)
+    timed('players:team', lambda: _widget(at, 'selectbox', "Select Team").set_value(team).run())
+    if any(w.label == "Select Statistic to View Distribution" for w in at.selectbox):
+        stat = rng.choice(['PPG', 'RPG', 'APG'])
+        timed('players:stat', lambda: _widget(at, 'selectbox', "Select Statistic to View Distribution")
+              .set_value(stat).run())
+
+
+def scenario_team_map(at, rng, timed):
+    timed('map:load', at.run)
+
+
+def scenario_playoff_race(at, rng, timed):
+    timed('playoffs:load', at.run)
+    conference = rng.choice(["Eastern", "Western"])
+    timed('playoffs:conference', lambda: at.radio[0].set_value(conference).run())
+    team = rng.choice(_widget(at, 'selectbox', "Select a team to analyze").options)
+    timed('playoffs:team', lambda: _widget(at, 'selectbox', "Select a team to analyze").set_value(team).run())
+    for _ in range(3):
+        value = round(rng.randrange(0, 21) * 0.05, 2)
+        timed('playoffs:slider', lambda: at.slider[0].set_value(value).run())
+
+
+PAGES = [
+    ('Entry.py', scenario_entry),
+    ('pages/1_Live_Games.py', scenario_live_games),
+    ('pages/2_Player_Statistics.py', scenario_player_stats),
+    ('pages/3_Team_Map.py', scenario_team_map),
+    ('pages/4_Playoff_Race.py', scenario_playoff_race),
+]
+
+
+# st.error messages that are page content rather than failures
+VERDICTS = ('faces an uphill battle to make the playoffs',)
+
+
+def _is_verdict(message):
+    return any(verdict in message for verdict in VERDICTS)
+
+
+def run_session(session_id, iterations, timeout):
+    """Run one simulated session in its own process and return its measurements.
+
+    AppTest swaps the global Runtime instance and config in and out around
+    every run, so sessions can't share a process; each one gets a fresh
+    interpreter (with the offline fixtures patched in) instead.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    patches = offline_patches()
+    for patch in patches:
+        patch.start()
+
+    rng = random.Random(session_id)
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+
+    def timed(name, action):
+        start = time.perf_counter()
+        at = action()
+        latencies[name].append(time.perf_counter() - start)
+        # Pages catch their own exceptions and show st.error, so count both
+        if at is not None and (at.exception or any(not _is_verdict(e.value) for e in at.error)):
+            errors[name] += 1
+
+    rss_before = _rss_mb()
+    started = time.time()
+    try:
+        for _ in range(iterations):
+            for script, scenario in rng.sample(PAGES, len(PAGES)):
+                at = AppTest.from_file(str(ROOT / script), default_timeout=timeout)
+                try:
+                    scenario(at, rng, timed)
+                except Exception:
+                    errors[script] += 1
+    finally:
+        for patch in patches:
+            patch.stop()
+    return {
+        'latencies': dict(latencies),
+        'errors': dict(errors),
+        'started': started,
+        'finished': time.time(),
+        'rss_mb': _rss_mb(),
+        'rss_growth_mb': _rss_mb() - rss_before,
+    }
+
+
+def _rss_mb():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except OSError:
+        # Peak rather than current RSS, but the best portable fallback
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_level(sessions, iterations, timeout):
+    with ProcessPoolExecutor(max_workers=sessions, mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = [pool.submit(run_session, i, iterations, timeout) for i in range(sessions)]
+        outcomes = [future.result() for future in futures]
+
+    results, errors = defaultdict(list), defaultdict(int)
+    for outcome in outcomes:
+        for name, values in outcome['latencies'].items():
+            results[name].extend(values)
+        for name, count in outcome['errors'].items():
+            errors[name] += count
+    # Measured from the first session starting work to the last one finishing,
+    # so interpreter start-up in the worker processes isn't counted
+    elapsed = max(o['finished'] for o in outcomes) - min(o['started'] for o in outcomes)
+
+    interactions = {}
+    for name, values in sorted(results.items()):
+        quantiles = statistics.quantiles(values, n=100) if len(values) > 1 else values * 99
+        interactions[name] = {
+            'count': len(values),
+            'p50_ms': quantiles[49] * 1000,
+            'p95_ms': quantiles[94] * 1000,
+            'p99_ms': quantiles[98] * 1000,
+        }
+    total = sum(len(values) for values in results.values())
+    return {
+        'sessions': sessions,
+        'interactions': interactions,
+        'throughput_per_s': total / elapsed if elapsed else 0.0,
+        'elapsed_s': elapsed,
+        # Summed over the session processes: what N isolated sessions cost the host
+        'total_rss_mb': sum(o['rss_mb'] for o in outcomes),
+        'total_rss_growth_mb': sum(o['rss_growth_mb'] for o in outcomes),
+        'errors': dict(errors),
+    }
+
+
+def print_level(level):
+    print(f"\n{level['sessions']} isolated session(s): {level['throughput_per_s']:.1f} interactions/s, "
+          f"{level['elapsed_s']:.1f}s, total RSS {level['total_rss_mb']:.1f} MB "
+          f"(+{level['total_rss_growth_mb']:.1f} MB during the run)")
+    print(f"  {'interaction':<22}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stats in level['interactions'].items():
+        print(f"  {name:<22}{stats['count']:>6}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}")
+    if level['errors']:
+        print(f"  errors: {level['errors']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 2, 4, 8, 16],
+                        help="isolated session counts to step through")
+    parser.add_argument('--iterations', type=int, default=3, help="passes over all pages per session")
+    parser.add_argument('--timeout', type=float, default=60, help="seconds allowed per script run")
+    parser.add_argument('--json', type=Path, help="also write the results here")
+    args = parser.parse_args(argv)
+
+    # Keep the run self-contained: no background warmer or API server threads
+    os.environ['NBA_CACHE_WARMER'] = '0'
+    os.environ.pop('NBA_API_PORT', None)
+    os.environ.pop('NBA_SHARED_CACHE_DIR', None)
+    os.chdir(ROOT)
+
+    # Worker processes inherit the environment above and patch in the fixtures themselves
+    levels = []
+    for sessions in args.sessions:
+        level = run_level(sessions, args.iterations, args.timeout)
+        print_level(level)
+        levels.append(level)
+
+    if args.json:
+        args.json.write_text(json.dumps(levels, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Uncached nba_api loaders shared by the app, the batch CLI and the API server.
+
+Nothing here imports Streamlit; utils wraps these with the app's cache layer.
+nba_api endpoints are imported inside each function to keep imports cheap.
+"""
+from datetime import date
+
+import pandas as pd
+
+from standings import parse_standings
+
+TOTAL_GAMES = 82
+
+
+def current_season(today=None):
+    """Season string (e.g. '2024-25') for the season in progress on ``today``."""
+    today = today or date.today()
+    start = today.year if today.month >= 10 else today.year - 1
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+def download_teams():
+    from nba_api.stats.static import teams
+
+    return pd.DataFrame(teams.get_teams())
+
+
+def download_players():
+    from nba_api.stats.static import players
+
+    return pd.DataFrame(players.get_players())
+
+
+def download_nba_data(season, players_df=None):
+    from nba_api.stats.endpoints import leagueleaders
+
+    # Get league leaders data
+    league_leaders = leagueleaders.LeagueLeaders(season=season)
+    df = league_leaders.get_data_frames()[0]
+
+    # Get players data for names if needed
+    if players_df is None:
+        players_df = download_players()
+
+    # Merge only if you need additional player information
+    df = df.merge(
+        players_df[['id', 'full_name']],
+        left_on='PLAYER_ID',
+        right_on='id',
+        how='left'
+    )
+
+    return df
+
+
+def download_current_standings():
+    from nba_api.stats.endpoints import leaguestandings
+
+    standings = leaguestandings.LeagueStandings()
+    return parse_standings(standings.get_data_frames()[0])
+
+
+def remaining_games(wins, losses):
+    """Regular season games left for a team with this record.
+
+    Derived from the standings rather than a separate game log, so it stays
+    consistent with the W-L the odds are computed from (including results
+    folded in from the live scoreboard).
+    """
+    return max(TOTAL_GAMES - (int(wins) + int(losses)), 0)
+
+
+def download_scoreboard():
+    """Today's games from the live scoreboard, as a list of dicts."""
+    from nba_api.live.nba.endpoints import scoreboard
+
+    games_dict = scoreboard.ScoreBoard().get_dict()
+    return games_dict.get('scoreboard', {}).get('games', [])
+
+
+def add_per_game_stats(df):
+    """Add PPG/RPG/APG columns to a league leaders frame in place."""
+    df['PPG'] = df['PTS'] / df['GP']
+    df['RPG'] = df['REB'] / df['GP']  # Rebounds Per Game
+    df['APG'] = df['AST'] / df['GP']  # Assists Per Game
+    return df
@@ -1,22 +1,21 @@
 import streamlit as st
-from nba_api.live.nba.endpoints import scoreboard
-from utils import render_footer
+from utils import get_live_scoreboard, render_footer, start_background_services
+
+start_background_services()
 
 # Add Live Games Section
 st.header("🏀 Live NBA Games")
 
 try:
-    games_data = scoreboard.ScoreBoard()
-    games_dict = games_data.get_dict()
+    games = get_live_scoreboard()
     
-    if 'scoreboard' in games_dict and 'games' in games_dict['scoreboard']:
-        games = games_dict['scoreboard']['games']
-        
+    if games:
         # Add refresh button at the top
         col1, col2, col3 = st.columns([2,1,2])
         with col2:
             if st.button("🔄 Refresh Scores", key="refresh_top"):
-                st.experimental_rerun()
+                get_live_scoreboard.clear()
+                st.rerun()
         
         for game in games:
             st.markdown('<div class="game-container">', unsafe_allow_html=True)
@@ -1,8 +1,9 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 from nba_api.stats.library.parameters import SeasonAll
-from utils import fetch_nba_data, fetch_teams, render_footer
+from nba_data import add_per_game_stats
+from utils import fetch_nba_data, fetch_teams, render_footer, start_background_services
+
+start_background_services()
 
 # CSS for styling
 st.markdown(
@@ -99,9 +100,7 @@ if season == SeasonAll.default:
     st.info("Showing all-time NBA statistics. This may take a moment to load.")
 
 # Calculate per game averages
-df['PPG'] = df['PTS'] / df['GP']
-df['RPG'] = df['REB'] / df['GP']  # Rebounds Per Game
-df['APG'] = df['AST'] / df['GP']  # Assists Per Game
+add_per_game_stats(df)
 
 # Filter by team
 if team_filter != "All Teams":
@@ -113,6 +112,9 @@ st.subheader("Filtered NBA Player Stats")
 st.dataframe(df[['PLAYER', 'TEAM', 'PPG', 'RPG', 'APG']])  # Show per game stats
 
 if not df.empty:
+    # plotly is only needed once there is something to chart
+    import plotly.express as px
+
     # Create two columns for chart layout
     col1, col2 = st.columns(2)
     
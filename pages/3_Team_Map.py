@@ -1,11 +1,7 @@
 import streamlit as st
-import folium
-from streamlit_folium import st_folium
-from utils import render_footer
+from utils import render_footer, start_background_services
 
-# Folium Map Visualization
-st.subheader("NBA Teams Map")
-nba_map = folium.Map(location=[37.0902, -95.7129], zoom_start=4)  # Center on the USA
+start_background_services()
 
 # Add team locations to the map
 team_locations = {
@@ -18,14 +14,28 @@ team_locations = {
     # Add more teams as needed
 }
 
-for team, coordinates in team_locations.items():
-    folium.Marker(
-        location=coordinates,
-        popup=f"<b>{team}</b>",
-        icon=folium.Icon(color="blue", icon="info-sign"),
-    ).add_to(nba_map)
 
-# Display map in Streamlit
-st_folium(nba_map, width=700, height=400)
+def render_map():
+    # folium is only imported once the header is on screen, so the page
+    # paints before the map library loads
+    import folium
+    from streamlit_folium import st_folium
+
+    nba_map = folium.Map(location=[37.0902, -95.7129], zoom_start=4)  # Center on the USA
+
+    for team, coordinates in team_locations.items():
+        folium.Marker(
+            location=coordinates,
+            popup=f"<b>{team}</b>",
+            icon=folium.Icon(color="blue", icon="info-sign"),
+        ).add_to(nba_map)
+
+    # Display map in Streamlit
+    st_folium(nba_map, width=700, height=400)
+
+
+# Folium Map Visualization
+st.subheader("NBA Teams Map")
+render_map()
 
-render_footer()
\ No newline at end of file
+render_footer()
@@ -1,16 +1,13 @@
 import streamlit as st
-from dotenv import load_dotenv
-from langchain_community.llms.cloudflare_workersai import CloudflareWorkersAI
-from langchain.prompts import ChatPromptTemplate
-from langchain.memory import ConversationBufferMemory
-from langchain.schema.runnable import RunnablePassthrough
 import os
-from nba_api.stats.endpoints import leaguestandings, teamgamelog
-from nba_api.stats.static import teams
-import plotly.graph_objects as go
-from utils import render_footer
+from playoffs import PLAYOFF_THRESHOLD, calculate_playoff_odds, lookup_playoff_odds, win_probability_needed
+from nba_data import remaining_games
+from utils import get_current_standings, get_odds_scenarios, render_footer, start_background_services
 
-load_dotenv()
+start_background_services()
+
+# Heavy dependencies (nba_api endpoints, plotly, langchain) are imported where
+# they are used so the page renders its header without waiting on them.
 
 # Add custom CSS
 st.markdown(
@@ -69,67 +66,6 @@ st.markdown(
 
 st.markdown('<h1 class="title">🏀 NBA Playoff Race Calculator</h1>', unsafe_allow_html=True)
 
-# Helper function to find team by city
-def find_team_by_city(city):
-    """Find team ID by city name"""
-    nba_teams = teams.get_teams()
-    for team in nba_teams:
-        if team['city'] == city:
-            return team
-    return None
-
-# Cache the standings data
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_current_standings():
-    standings = leaguestandings.LeagueStandings()
-    df = standings.get_data_frames()[0]
-    
-    # Rename columns to match our needs
-    df['WINS'] = df['Oct'].str.split('-').str[0].astype(int) + df['Nov'].str.split('-').str[0].astype(int)
-    df['LOSSES'] = df['Oct'].str.split('-').str[1].astype(int) + df['Nov'].str.split('-').str[1].astype(int)
-    
-    # Calculate win percentage
-    df['WinPCT'] = df['WINS'] / (df['WINS'] + df['LOSSES'])
-    
-    # Get L10 from PreAS (Pre All-Star) record
-    df['L10'] = df['PreAS']
-    
-    # Clean up conference names
-    df['Conference'] = df['Conference'].map({'East': 'Eastern', 'West': 'Western'})
-    
-    return df[['TeamCity', 'TeamName', 'WINS', 'LOSSES', 'WinPCT', 'L10', 'Conference', 'PlayoffRank']]
-
-# Cache remaining games data
-@st.cache_data(ttl=3600)
-def get_remaining_games(team_id):
-    game_log = teamgamelog.TeamGameLog(team_id=team_id, season_type_all_star='Regular Season').get_data_frames()[0]
-    total_games = 82
-    remaining_games = total_games - len(game_log)
-    return remaining_games
-
-def calculate_playoff_odds(current_wins, current_losses, remaining_games, win_probability):
-    total_possible_outcomes = 2 ** remaining_games
-    favorable_outcomes = 0
-    
-    # Calculate playoff threshold (usually around 43-45 wins in an 82-game season)
-    playoff_threshold = 43
-    
-    for scenario in range(total_possible_outcomes):
-        additional_wins = bin(scenario).count('1')
-        additional_losses = remaining_games - additional_wins
-        
-        # Calculate probability of this scenario
-        scenario_probability = (
-            win_probability ** additional_wins *
-            (1 - win_probability) ** additional_losses
-        )
-        
-        final_wins = current_wins + additional_wins
-        if final_wins >= playoff_threshold:
-            favorable_outcomes += scenario_probability
-            
-    return favorable_outcomes * 100  # Convert to percentage
-
 # Get current standings
 try:
     standings_df = get_current_standings()
@@ -181,108 +117,171 @@ try:
             (conf_standings['TeamCity'] + ' ' + conf_standings['TeamName']) == selected_team
         ].iloc[0]
         
-        # Get remaining games
-        team_info = find_team_by_city(team_data['TeamCity'])
-        if team_info:
-            team_id = team_info['id']
-            remaining = get_remaining_games(team_id)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Current Wins", int(team_data['WINS']))
-            with col2:
-                st.metric("Current Losses", int(team_data['LOSSES']))
-            with col3:
-                st.metric("Remaining Games", remaining)
-            
-            # Win probability slider
-            st.subheader("Projected Win Probability")
-            win_prob = st.slider(
-                "Estimated win probability for remaining games",
-                min_value=0.0,
-                max_value=1.0,
-                value=float(team_data['WinPCT']),
-                step=0.05
+        # The standings row carries the team id; it keys the odds scenario cache
+        team_id = int(team_data['TeamID'])
+        remaining = remaining_games(team_data['WINS'], team_data['LOSSES'])
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Current Wins", int(team_data['WINS']))
+        with col2:
+            st.metric("Current Losses", int(team_data['LOSSES']))
+        with col3:
+            st.metric("Remaining Games", remaining)
+        
+        # Win probability slider
+        st.subheader("Projected Win Probability")
+        win_prob = st.slider(
+            "Estimated win probability for remaining games",
+            min_value=0.0,
+            max_value=1.0,
+            value=float(team_data['WinPCT']),
+            step=0.05
+        )
+        
+        # Calculate and display playoff odds
+        if remaining > 0:
+            # Odds for every win probability and threshold are computed once per
+            # team and standings snapshot; moving the slider is just a lookup
+            scenarios = get_odds_scenarios(
+                int(team_id),
+                int(team_data['WINS']),
+                int(team_data['LOSSES']),
+                remaining
             )
-            
-            # Calculate and display playoff odds
-            if remaining > 0:
+            odds = lookup_playoff_odds(scenarios, win_prob)
+            if odds is None:
+                # The slider starts at the team's exact win % which is off the grid
                 odds = calculate_playoff_odds(
                     team_data['WINS'],
                     team_data['LOSSES'],
                     remaining,
                     win_prob
                 )
-                
-                # Create a gauge chart for playoff odds
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=odds,
-                    title={'text': "Playoff Chances", 'font': {'size': 24, 'color': '#FFFFFF'}},
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    gauge={
-                        'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "#FFFFFF"},
-                        'bar': {'color': "#3498db"},
-                        'bgcolor': "rgba(0,0,0,0)",
-                        'borderwidth': 2,
-                        'bordercolor': "#FFFFFF",
-                        'steps': [
-                            {'range': [0, 20], 'color': "#ff6b6b"},
-                            {'range': [20, 40], 'color': "#ffd93d"},
-                            {'range': [40, 60], 'color': "#6c5ce7"},
-                            {'range': [60, 80], 'color': "#a8e6cf"},
-                            {'range': [80, 100], 'color': "#00b894"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 50
-                        }
+            
+            import plotly.graph_objects as go
+
+            # Create a gauge chart for playoff odds
+            fig = go.Figure(go.Indicator(
+                mode="gauge+number",
+                value=odds,
+                title={'text': "Playoff Chances", 'font': {'size': 24, 'color': '#FFFFFF'}},
+                domain={'x': [0, 1], 'y': [0, 1]},
+                gauge={
+                    'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "#FFFFFF"},
+                    'bar': {'color': "#3498db"},
+                    'bgcolor': "rgba(0,0,0,0)",
+                    'borderwidth': 2,
+                    'bordercolor': "#FFFFFF",
+                    'steps': [
+                        {'range': [0, 20], 'color': "#ff6b6b"},
+                        {'range': [20, 40], 'color': "#ffd93d"},
+                        {'range': [40, 60], 'color': "#6c5ce7"},
+                        {'range': [60, 80], 'color': "#a8e6cf"},
+                        {'range': [80, 100], 'color': "#00b894"}
+                    ],
+                    'threshold': {
+                        'line': {'color': "red", 'width': 4},
+                        'thickness': 0.75,
+                        'value': 50
                     }
-                ))
-                
-                fig.update_layout(
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font={'color': '#FFFFFF'}
-                )
-                
-                st.plotly_chart(fig)
-                
-                # Add analysis text
-                if odds >= 90:
-                    st.success(f"🎉 {selected_team} has an excellent chance of making the playoffs!")
-                elif odds >= 70:
-                    st.info(f"👍 {selected_team} is likely to make the playoffs.")
-                elif odds >= 40:
-                    st.warning(f"😅 {selected_team} is in the playoff bubble - every game counts!")
-                else:
-                    st.error(f"😟 {selected_team} faces an uphill battle to make the playoffs.")
-                
-                # Show potential final records
-                st.subheader("Potential Final Records")
-                best_case = team_data['WINS'] + remaining
-                worst_case = team_data['WINS']
-                expected_wins = team_data['WINS'] + (remaining * win_prob)
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Best Case", f"{best_case}-{team_data['LOSSES']}")
-                with col2:
-                    st.metric("Expected", f"{int(expected_wins)}-{int(team_data['LOSSES'] + (remaining * (1-win_prob)))}")
-                with col3:
-                    st.metric("Worst Case", f"{worst_case}-{team_data['LOSSES'] + remaining}")
+                }
+            ))
+            
+            fig.update_layout(
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font={'color': '#FFFFFF'}
+            )
+            
+            st.plotly_chart(fig)
             
+            # Add analysis text
+            if odds >= 90:
+                st.success(f"🎉 {selected_team} has an excellent chance of making the playoffs!")
+            elif odds >= 70:
+                st.info(f"👍 {selected_team} is likely to make the playoffs.")
+            elif odds >= 40:
+                st.warning(f"😅 {selected_team} is in the playoff bubble - every game counts!")
             else:
-                st.info("Regular season is complete for this team.")
+                st.error(f"😟 {selected_team} faces an uphill battle to make the playoffs.")
+            
+            # Show potential final records
+            st.subheader("Potential Final Records")
+            best_case = team_data['WINS'] + remaining
+            worst_case = team_data['WINS']
+            expected_wins = team_data['WINS'] + (remaining * win_prob)
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Best Case", f"{best_case}-{team_data['LOSSES']}")
+            with col2:
+                st.metric("Expected", f"{int(expected_wins)}-{int(team_data['LOSSES'] + (remaining * (1-win_prob)))}")
+            with col3:
+                st.metric("Worst Case", f"{worst_case}-{team_data['LOSSES'] + remaining}")
+            
+            # Odds across the whole win probability range
+            st.subheader("Playoff Odds Scenarios")
+            curve = go.Figure(go.Scatter(
+                x=scenarios.index,
+                y=scenarios[PLAYOFF_THRESHOLD],
+                mode='lines',
+                line={'color': '#3498db', 'width': 3},
+                name="Playoff odds"
+            ))
+            curve.add_vline(x=win_prob, line={'color': 'red', 'dash': 'dash'})
+            curve.update_layout(
+                xaxis_title="Win probability for remaining games",
+                yaxis_title="Playoff odds (%)",
+                yaxis={'range': [0, 100]},
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font={'color': '#FFFFFF'}
+            )
+            st.plotly_chart(curve)
+            
+            # Wins needed for common odds targets
+            wins_needed = max(PLAYOFF_THRESHOLD - int(team_data['WINS']), 0)
+            cols = st.columns(3)
+            for col, target in zip(cols, [50, 75, 90]):
+                needed = win_probability_needed(scenarios, target)
+                with col:
+                    if needed is None:
+                        st.metric(f"For {target}% odds", "Out of reach")
+                    else:
+                        st.metric(
+                            f"For {target}% odds",
+                            f"{needed:.0%} win rate",
+                            f"~{round(needed * remaining)} of {remaining} games",
+                            delta_color="off"
+                        )
+            st.caption(f"{wins_needed} more wins reach the {PLAYOFF_THRESHOLD}-win playoff line.")
+            
+            # Odds at the selected win probability for nearby win thresholds
+            thresholds = [t for t in range(PLAYOFF_THRESHOLD - 4, PLAYOFF_THRESHOLD + 5) if t in scenarios.columns]
+            nearest = scenarios.index.get_indexer([win_prob], method='nearest')[0]
+            st.dataframe(
+                scenarios.iloc[[nearest]][thresholds]
+                .rename(index=lambda p: f"{p:.0%} win rate", columns=lambda t: f"{t} wins")
+                .round(1)
+            )
+        
         else:
-            st.error(f"Could not find team ID for {team_data['TeamCity']}")
+            st.info("Regular season is complete for this team.")
         # Add AI Analysis section
         st.subheader("🤖 AI Analysis")
         
         # Initialize the LLM and conversation chain
         @st.cache_resource
         def initialize_chat(team_data, standings_data):
+            from dotenv import load_dotenv
+            from langchain_community.llms.cloudflare_workersai import CloudflareWorkersAI
+            from langchain.prompts import ChatPromptTemplate
+            from langchain.memory import ConversationBufferMemory
+            from langchain.schema.runnable import RunnablePassthrough
+
+            load_dotenv()
+
             llm = CloudflareWorkersAI(
                 account_id=os.getenv('CLOUDFLARE_ACCOUNT_ID'),
                 api_token=os.getenv('CLOUDFLARE_API_TOKEN'),
@@ -331,8 +330,10 @@ try:
 
             return chain, memory
 
-        # Initialize chat
-        chain, memory = initialize_chat(team_data, standings_display)
+        # The chain (and langchain itself) is only loaded once a question is asked
+        def ask(question):
+            chain, memory = initialize_chat(team_data, standings_display)
+            return chain.invoke({"input": question})
 
         # Create the chat interface
         if "messages" not in st.session_state:
@@ -354,7 +355,7 @@ try:
 
             # Generate AI response
             with st.chat_message("assistant"):
-                response = chain.invoke({"input": prompt})
+                response = ask(prompt)
                 st.markdown(response)
                 
             # Add AI response to chat history
@@ -378,7 +379,7 @@ try:
                 st.session_state.messages.append({"role": "user", "content": q})
                 
                 with st.chat_message("assistant"):
-                    response = chain.invoke({"input": q})
+                    response = ask(q)
                     st.markdown(response)
                 st.session_state.messages.append({"role": "assistant", "content": response})
     
@@ -0,0 +1,69 @@
+"""Playoff odds shared by the playoff page and the batch CLI."""
+from math import comb
+
+import numpy as np
+import pandas as pd
+
+from nba_data import TOTAL_GAMES
+
+# Calculate playoff threshold (usually around 43-45 wins in an 82-game season)
+PLAYOFF_THRESHOLD = 43
+
+# Win probabilities the scenario explorer precomputes (0.00, 0.01, ..., 1.00)
+PROBABILITY_GRID = np.round(np.linspace(0, 1, 101), 2)
+
+
+def calculate_playoff_odds(current_wins, current_losses, remaining_games, win_probability,
+                           playoff_threshold=PLAYOFF_THRESHOLD):
+    """Chance (in percent) of reaching ``playoff_threshold`` wins.
+
+    Each remaining game is an independent win with ``win_probability``, so the
+    number of additional wins is binomial; summing its upper tail gives the
+    same result as enumerating all 2 ** remaining_games outcomes.
+    """
+    wins_needed = max(playoff_threshold - int(current_wins), 0)
+    favorable_outcomes = sum(
+        comb(remaining_games, wins) * win_probability ** wins * (1 - win_probability) ** (remaining_games - wins)
+        for wins in range(wins_needed, remaining_games + 1)
+    )
+    return favorable_outcomes * 100  # Convert to percentage
+
+
+def playoff_odds_grid(current_wins, remaining_games, probabilities=PROBABILITY_GRID, thresholds=None):
+    """Playoff odds (in percent) for every win probability and win threshold at once.
+
+    Returns a DataFrame indexed by win probability with one column per final
+    win threshold (0..82 by default), built from a single binomial pmf matrix
+    instead of one ``calculate_playoff_odds`` call per cell.
+    """
+    if thresholds is None:
+        thresholds = np.arange(TOTAL_GAMES + 1)
+    probabilities = np.asarray(probabilities, dtype=float)
+    thresholds = np.asarray(thresholds)
+
+    wins = np.arange(remaining_games + 1)
+    coefficients = np.array([comb(remaining_games, k) for k in wins], dtype=float)
+    p = probabilities[:, None]
+    pmf = coefficients * p ** wins * (1 - p) ** (remaining_games - wins)
+    # at_least[:, k] = P(at least k more wins); a trailing 0 covers k > remaining
+    at_least = np.concatenate([pmf[:, ::-1].cumsum(axis=1)[:, ::-1], np.zeros((len(p), 1))], axis=1)
+
+    wins_needed = np.clip(thresholds - int(current_wins), 0, remaining_games + 1)
+    odds = np.minimum(at_least[:, wins_needed], 1.0) * 100
+    return pd.DataFrame(odds, index=pd.Index(probabilities, name='WinProbability'), columns=thresholds)
+
+
+def lookup_playoff_odds(grid, win_probability, playoff_threshold=PLAYOFF_THRESHOLD):
+    """Odds for ``win_probability`` from a precomputed grid, or None if it isn't on the grid."""
+    key = round(float(win_probability), 2)
+    if abs(key - win_probability) > 1e-9 or key not in grid.index or playoff_threshold not in grid.columns:
+        return None
+    return float(grid.at[key, playoff_threshold])
+
+
+def win_probability_needed(grid, target_odds, playoff_threshold=PLAYOFF_THRESHOLD):
+    """Smallest win probability on the grid that gives at least ``target_odds`` percent, or None."""
+    odds = grid[playoff_threshold]
+    reached = odds.index[odds.to_numpy() >= target_odds]
+    return float(reached[0]) if len(reached) else None
+
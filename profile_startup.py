@@ -0,0 +1,158 @@
+"""Report per-module import time for each page of the app.
+
+Every page's module-level imports are replayed in a fresh interpreter with
+``python -X importtime`` so the numbers reflect a cold start on a new pod.
+Imports that live inside functions (loaded only when a feature renders) are
+listed as deferred cost, each profiled on its own on top of the page's startup
+imports. First-party modules the page uses (utils, nba_data, playoffs, ...)
+are followed, so imports deferred inside them are reported too.
+
+    python profile_startup.py
+    python profile_startup.py --top 15 pages/4_Playoff_Race.py
+    python profile_startup.py --by module --top 30
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_SCRIPTS = [ROOT / "Entry.py", *sorted((ROOT / "pages").glob("*.py"))]
+
+
+def _first_party(node):
+    """Paths of the repo's own modules imported by an import statement."""
+    if isinstance(node, ast.ImportFrom):
+        names = [node.module] if node.module and not node.level else []
+    else:
+        names = [alias.name for alias in node.names]
+    paths = [ROOT / f"{name.split('.')[0]}.py" for name in names]
+    return [path for path in paths if path.exists()]
+
+
+def collect_imports(path):
+    """Split a script's imports into startup source lines and deferred ones.
+
+    Returns (startup, deferred) where deferred is a list of (statement, origin)
+    pairs. Function-level imports in first-party modules reachable from the
+    script are included in deferred, with the file and line they come from.
+    """
+    startup, deferred = [], {}
+    pending, visited = [Path(path).resolve()], set()
+    while pending:
+        module_path = pending.pop()
+        if module_path in visited:
+            continue
+        visited.add(module_path)
+        tree = ast.parse(module_path.read_text(encoding="utf-8"))
+        top_level = {id(node) for node in tree.body}
+        for node in ast.walk(tree):
+            if not isinstance(node, (ast.Import, ast.ImportFrom)):
+                continue
+            pending.extend(_first_party(node))
+            line = ast.unparse(node)
+            if id(node) not in top_level:
+                deferred.setdefault(line, f"{os.path.relpath(module_path, ROOT)}:{node.lineno}")
+            elif module_path == Path(path).resolve() and line not in startup:
+                startup.append(line)
+    return startup, list(deferred.items())
+
+
+def profile_imports(statements, preload=()):
+    """Run ``statements`` under ``-X importtime`` and return per-module timings.
+
+    Modules imported by ``preload`` are loaded first and excluded, so deferred
+    imports are only charged for what they add on top of startup.
+    Returns a list of (module, self_us, cumulative_us) and the wall total in us.
+    """
+    if not statements:
+        return [], 0
+    code = "\n".join(list(preload) + ["import sys as _s; _s.stderr.write('-- mark --\\n')"] + list(statements))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        last_line = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(last_line[0])
+
+    rows = []
+    seen_mark = False
+    for line in proc.stderr.splitlines():
+        if line.startswith("-- mark --"):
+            seen_mark = True
+            continue
+        if not seen_mark or not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.rstrip(), int(self_us), int(cumulative_us)))
+
+    # Top-level entries (no indentation) add up to the wall time of the block
+    total = sum(cum for module, _, cum in rows if not module.startswith("  "))
+    return rows, total
+
+
+def print_report(title, rows, total, top, by="package"):
+    """Print the slowest packages (self time summed) or modules (self and cumulative)."""
+    print(f"  {title}: {total / 1000:.1f} ms")
+    if by == "module":
+        print(f"    {'self ms':>9}  {'cumul ms':>9}  module")
+        for module, self_us, cumulative_us in sorted(rows, key=lambda row: -row[1])[:top]:
+            print(f"    {self_us / 1000:9.1f}  {cumulative_us / 1000:9.1f}  {module.strip()}")
+        return
+    by_package = {}
+    for module, self_us, _ in rows:
+        package = module.strip().split(".")[0]
+        by_package[package] = by_package.get(package, 0) + self_us
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"    {self_us / 1000:9.1f} ms  {package}")
+
+
+def print_deferred(deferred, startup):
+    """Profile each deferred import on its own, so one missing optional
+    dependency doesn't hide the cost of the others."""
+    results = []
+    for statement, origin in deferred:
+        try:
+            _, total = profile_imports([statement], preload=startup)
+        except RuntimeError as e:
+            results.append((None, statement, origin, str(e)))
+        else:
+            results.append((total, statement, origin, None))
+
+    measured = [result for result in results if result[0] is not None]
+    print(f"  deferred imports (each on top of startup): {len(measured)} of {len(results)} profiled")
+    for total, statement, origin, error in sorted(measured, key=lambda result: -result[0]):
+        print(f"    {total / 1000:9.1f} ms  {statement}  ({origin})")
+    for _, statement, origin, error in results:
+        if error is not None:
+            print(f"       failed  {statement}  ({origin}): {error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="*", type=Path, default=DEFAULT_SCRIPTS)
+    parser.add_argument("--top", type=int, default=10, help="packages or modules to list per page")
+    parser.add_argument("--by", choices=["package", "module"], default="package",
+                        help="group self time by top-level package, or list individual modules")
+    args = parser.parse_args(argv)
+
+    for script in args.scripts:
+        startup, deferred = collect_imports(script)
+        print(os.path.relpath(script, ROOT))
+        try:
+            rows, total = profile_imports(startup)
+        except RuntimeError as e:
+            print(f"  could not profile startup imports: {e}")
+        else:
+            print_report("startup imports", rows, total, args.top, args.by)
+            print_deferred(deferred, startup)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Host-level data store shared by every Streamlit replica on the machine.
+
+Datasets are written once as uncompressed Arrow IPC (Feather v2) files and
+memory-mapped by every process, so the column buffers live once in the page
+cache instead of once per replica, and upstream is hit once per host.
+
+Publishing writes to a temporary file and ``os.replace``-s it over the old
+one, which is atomic: readers either map the previous file or the new one,
+never a partial write. Processes that still hold the previous mapping keep
+reading it until they notice the swap on their next load.
+
+The store is enabled by pointing ``NBA_SHARED_CACHE_DIR`` at a directory
+(ideally on tmpfs, e.g. /dev/shm/nba-cache) and requires pyarrow.
+"""
+import fcntl
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class SharedFrameStore:
+    def __init__(self, root):
+        # pyarrow is optional and slow to import, so it is only loaded once a
+        # store is actually configured
+        import pyarrow.feather as feather
+
+        self._feather = feather
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        # key -> ((st_ino, st_mtime_ns), memory-mapped pyarrow.Table)
+        self._tables = {}
+        # keys this process is refreshing in the background
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def path(self, key):
+        return self.root / (re.sub(r"[^A-Za-z0-9_.-]", "_", key) + ".arrow")
+
+    def age(self, key):
+        """Seconds since ``key`` was last published, or None if it never was."""
+        try:
+            return time.time() - self.path(key).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def table(self, key):
+        """Return the memory-mapped Arrow table for ``key``, or None if missing."""
+        path = self.path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        identity = (stat.st_ino, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._tables.get(key)
+            if cached is not None and cached[0] == identity:
+                return cached[1]
+            try:
+                table = self._feather.read_table(path, memory_map=True)
+            except FileNotFoundError:
+                # Swapped out between stat() and open(); the next load picks up the new file
+                return cached[1] if cached is not None else None
+            self._tables[key] = (identity, table)
+            return table
+
+    def read(self, key):
+        table = self.table(key)
+        if table is None:
+            return None
+        # Each caller gets its own DataFrame, as st.cache_data would hand out
+        return table.to_pandas(split_blocks=True)
+
+    def publish(self, key, df):
+        path = self.path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=path.name, suffix=".tmp")
+        os.close(fd)
+        try:
+            # Uncompressed so readers can map the buffers without decoding them
+            self._feather.write_feather(df.reset_index(drop=True), tmp, compression="uncompressed")
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @contextmanager
+    def _locked(self, key):
+        with open(self.path(key).with_suffix(".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def refresh(self, key, download, *args, max_age=None):
+        """Download and publish ``key`` unless a fresh enough copy exists.
+
+        Only one process per host downloads at a time; the others wait on the
+        lock and then find the copy it just published.
+        """
+        with self._locked(key):
+            age = self.age(key)
+            if age is not None and (max_age is None or age < max_age):
+                return
+            self.publish(key, download(*args))
+
+    def _refresh_in_background(self, key, download, args, max_age):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self.refresh(key, download, *args, max_age=max_age)
+            except Exception:
+                logger.exception("Shared store refresh failed for %s", key)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"shared-store-refresh-{key}", daemon=True).start()
+
+    def load(self, key, download, *args, max_age=None):
+        """Read ``key``, downloading it first only if it has never been published.
+
+        A copy older than ``max_age`` is still served as is; it is refreshed in
+        a background thread (normally the cache warmer gets there first), so
+        readers never wait on upstream while a complete file is on disk.
+        """
+        age = self.age(key)
+        if age is None:
+            self.refresh(key, download, *args)
+        elif max_age is not None and age >= max_age:
+            self._refresh_in_background(key, download, args, max_age)
+        return self.read(key)
+
+
+def from_env():
+    """Return the store configured by NBA_SHARED_CACHE_DIR, or None if disabled."""
+    root = os.getenv("NBA_SHARED_CACHE_DIR")
+    if not root:
+        return None
+    try:
+        return SharedFrameStore(root)
+    except ImportError:
+        logger.warning("NBA_SHARED_CACHE_DIR is set but pyarrow is not installed; using per-process caches")
+        return None
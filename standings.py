@@ -0,0 +1,207 @@
+"""Turn the raw LeagueStandings frame into the columns the app works with.
+
+Every "W-L" split column (monthly records, HOME/ROAD, L10, conference and
+division records, ...) is parsed in one vectorized pass into integer
+``<column>_W`` / ``<column>_L`` columns. The season record comes from the
+Record column; the monthly columns are kept as splits only.
+``apply_game_results`` then folds in games that finished after the standings
+were fetched, without another API call.
+
+Kept free of Streamlit so the batch CLI and the API server can use it too.
+"""
+import calendar
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+RECORD_PATTERN = r'^\s*(\d+)-(\d+)\s*$'
+STREAK_PATTERN = r'^\s*([WL])\s*(\d+)\s*$'
+RECORD_DTYPE = np.int16
+MONTHS = list(calendar.month_abbr)[1:]
+CONFERENCE_SPLITS = {'Eastern': 'vsEast', 'Western': 'vsWest'}
+
+BASE_COLUMNS = ['TeamID', 'TeamCity', 'TeamName', 'WINS', 'LOSSES', 'WinPCT', 'L10', 'Conference', 'Division',
+                'PlayoffRank']
+
+
+def parse_records(df):
+    """Parse every "W-L" column of ``df`` into integer ``_W``/``_L`` columns.
+
+    All candidate (string) columns are flattened into a single Series so the
+    regex runs once over the whole frame rather than once per column. A column
+    counts as a record column when every non-blank value in it matches.
+    """
+    candidates = [column for column in df.columns if pd.api.types.is_string_dtype(df[column].dtype)]
+    if not candidates:
+        return pd.DataFrame(index=df.index)
+
+    values = pd.Series(df[candidates].to_numpy().ravel(), dtype='string')
+    parsed = values.str.extract(RECORD_PATTERN)
+    wins = parsed[0].to_numpy(dtype=float, na_value=np.nan).reshape(len(df), len(candidates))
+    losses = parsed[1].to_numpy(dtype=float, na_value=np.nan).reshape(len(df), len(candidates))
+
+    blank = values.fillna('').str.strip().eq('').to_numpy().reshape(len(df), len(candidates))
+    matched = ~np.isnan(wins)
+    is_record = (matched | blank).all(axis=0) & matched.any(axis=0)
+
+    columns = {}
+    for i in np.flatnonzero(is_record):
+        name = candidates[i]
+        # Blank records (e.g. months not played yet) count as 0-0
+        columns[f'{name}_W'] = np.nan_to_num(wins[:, i]).astype(RECORD_DTYPE)
+        columns[f'{name}_L'] = np.nan_to_num(losses[:, i]).astype(RECORD_DTYPE)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def parse_streak(streak):
+    """'W 3' -> 3, 'L 2' -> -2, anything else -> 0."""
+    parsed = pd.Series(streak, dtype='string').str.extract(STREAK_PATTERN)
+    length = parsed[1].to_numpy(dtype=float, na_value=0)
+    sign = np.where(parsed[0].to_numpy(dtype=object, na_value='') == 'L', -1, 1)
+    return (sign * length).astype(RECORD_DTYPE)
+
+
+def parse_standings(df):
+    records = parse_records(df)
+
+    out = df[[column for column in ['TeamID', 'TeamCity', 'TeamName', 'L10', 'Conference', 'Division', 'PlayoffRank']
+              if column in df]].copy()
+    # Take the season record as reported rather than summing monthly splits,
+    # which miss any month not in the list (e.g. games played in the bubble)
+    out['WINS'] = records['Record_W']
+    out['LOSSES'] = records['Record_L']
+
+    # Calculate win percentage
+    games = out['WINS'] + out['LOSSES']
+    out['WinPCT'] = (out['WINS'] / games.where(games > 0)).fillna(0.0)
+
+    out['Streak'] = parse_streak(df['strCurrentStreak']) if 'strCurrentStreak' in df else np.zeros(len(df), RECORD_DTYPE)
+
+    # Clean up conference names
+    out['Conference'] = out['Conference'].map({'East': 'Eastern', 'West': 'Western'})
+
+    return pd.concat([out[BASE_COLUMNS + ['Streak']], records], axis=1)
+
+
+def _result_rows(games):
+    """One row per team per finished game from live scoreboard game dicts."""
+    rows = []
+    for game in games:
+        if game.get('gameStatus') != 3:
+            continue
+        home, away = game['homeTeam'], game['awayTeam']
+        month = None
+        if game.get('gameEt'):
+            month = datetime.fromisoformat(game['gameEt'].replace('Z', '+00:00')).strftime('%b')
+        for team, opponent, is_home in ((home, away, True), (away, home, False)):
+            rows.append({
+                'TeamID': team['teamId'],
+                'OpponentID': opponent['teamId'],
+                'Won': team['score'] > opponent['score'],
+                'Home': is_home,
+                'Month': month,
+                'Score': team['score'],
+                'OpponentScore': opponent['score'],
+                # The scoreboard reports each team's record including this game
+                'GamesAfter': team['wins'] + team['losses'],
+            })
+    return pd.DataFrame(rows)
+
+
+def _result_splits(results, standings):
+    """Map each split a scoreboard result can update to a mask over ``results``
+    of the games that count towards it."""
+    by_team = standings.set_index('TeamID')
+    margin = (results['Score'] - results['OpponentScore']).abs().to_numpy()
+    splits = {
+        'Record': np.ones(len(results), dtype=bool),
+        'HOME': results['Home'].to_numpy(),
+        'ROAD': ~results['Home'].to_numpy(),
+        'ThreePTSOrLess': margin <= 3,
+        'TenPTSOrMore': margin >= 10,
+        'Score100PTS': results['Score'].to_numpy() >= 100,
+        'OppScore100PTS': results['OpponentScore'].to_numpy() >= 100,
+    }
+
+    conference = by_team['Conference']
+    opponent_conference = conference.reindex(results['OpponentID']).to_numpy()
+    splits['ConferenceRecord'] = conference.reindex(results['TeamID']).to_numpy() == opponent_conference
+    for name, column in CONFERENCE_SPLITS.items():
+        splits[column] = opponent_conference == name
+
+    if 'Division' in by_team:
+        division = by_team['Division']
+        opponent_division = division.reindex(results['OpponentID']).to_numpy()
+        splits['DivisionRecord'] = division.reindex(results['TeamID']).to_numpy() == opponent_division
+        for name in division.dropna().unique():
+            splits[f'vs{name}'] = opponent_division == name
+
+    # Without a game date the monthly splits can't be placed
+    if results['Month'].notna().all():
+        for month in MONTHS:
+            splits[month] = (results['Month'] == month).to_numpy()
+    return splits
+
+
+def apply_game_results(standings, games):
+    """Return ``standings`` updated with finished games not yet counted in it.
+
+    ``games`` are live scoreboard game dicts. A result is only applied when
+    the team's games played in ``standings`` are behind the record the
+    scoreboard reports, so applying the same games twice is harmless.
+
+    Splits the scoreboard can place (home/road, conference, division, vs
+    conference/division, month, margin and 100-point splits) are updated.
+    The others (L10, PreAS/PostAS, OT, at-half, ...) would need more than
+    the final score, so they are set to missing for the teams that played
+    until the next full refresh, rather than left disagreeing with Record.
+    """
+    results = _result_rows(games)
+    if results.empty:
+        return standings
+
+    standings = standings.copy()
+    by_team = standings.set_index('TeamID')
+    played = (by_team['WINS'] + by_team['LOSSES']).reindex(results['TeamID']).to_numpy()
+    results = results[played < results['GamesAfter'].to_numpy()].reset_index(drop=True)
+    if results.empty:
+        return standings
+
+    row = standings.index[pd.Index(standings['TeamID']).get_indexer(results['TeamID'])]
+
+    def add(column, mask):
+        if column not in standings or not mask.any():
+            return
+        increments = pd.Series(1, index=row[mask]).groupby(level=0).sum()
+        standings.loc[increments.index, column] += increments.astype(RECORD_DTYPE)
+
+    won = results['Won'].to_numpy()
+    add('WINS', won)
+    add('LOSSES', ~won)
+    splits = _result_splits(results, standings)
+    for split, mask in splits.items():
+        add(f'{split}_W', won & mask)
+        add(f'{split}_L', ~won & mask)
+
+    played_rows = row.unique()
+    stale = [column[:-2] for column in standings.columns
+             if column.endswith('_W') and f'{column[:-2]}_L' in standings and column[:-2] not in splits]
+    for split in stale:
+        for column in (f'{split}_W', f'{split}_L'):
+            standings[column] = standings[column].astype('Int16')
+            standings.loc[played_rows, column] = pd.NA
+    if 'L10' in standings:
+        standings.loc[played_rows, 'L10'] = None
+
+    games_played = standings['WINS'] + standings['LOSSES']
+    standings['WinPCT'] = (standings['WINS'] / games_played.where(games_played > 0)).fillna(0.0)
+
+    # Extend or reset the streak with each team's latest result
+    latest = results.assign(Row=row).groupby('Row').tail(1)
+    streak = standings.loc[latest['Row'], 'Streak'].to_numpy()
+    won = latest['Won'].to_numpy()
+    standings.loc[latest['Row'], 'Streak'] = np.where(
+        won, np.where(streak > 0, streak + 1, 1), np.where(streak < 0, streak - 1, -1)
+    ).astype(RECORD_DTYPE)
+    return standings
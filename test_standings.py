@@ -0,0 +1,106 @@
+import pandas as pd
+
+import standings
+
+ATL, BOS, LAL, DEN = 1, 2, 3, 4
+
+
+def raw_standings():
+    """Four teams, LeagueStandings-shaped, 10 games in."""
+    return pd.DataFrame([
+        {'TeamID': ATL, 'TeamCity': 'Atlanta', 'TeamName': 'Hawks', 'Conference': 'East', 'Division': 'Southeast',
+         'PlayoffRank': 2, 'Record': '4-6', 'HOME': '2-3', 'ROAD': '2-3', 'L10': '4-6', 'ConferenceRecord': '3-3',
+         'DivisionRecord': '1-1', 'vsEast': '3-3', 'vsWest': '1-3', 'vsAtlantic': '2-2', 'vsSoutheast': '1-1',
+         'vsPacific': '1-3', 'vsNorthwest': '0-0', 'Mar': '4-6', 'Jul': '', 'PreAS': '4-6', 'PostAS': '0-0',
+         'strCurrentStreak': 'L 1'},
+        {'TeamID': BOS, 'TeamCity': 'Boston', 'TeamName': 'Celtics', 'Conference': 'East', 'Division': 'Atlantic',
+         'PlayoffRank': 1, 'Record': '7-3', 'HOME': '4-1', 'ROAD': '3-2', 'L10': '7-3', 'ConferenceRecord': '4-2',
+         'DivisionRecord': '2-0', 'vsEast': '4-2', 'vsWest': '3-1', 'vsAtlantic': '2-0', 'vsSoutheast': '2-2',
+         'vsPacific': '1-1', 'vsNorthwest': '2-0', 'Mar': '7-3', 'Jul': '', 'PreAS': '7-3', 'PostAS': '0-0',
+         'strCurrentStreak': 'W 3'},
+        {'TeamID': LAL, 'TeamCity': 'Los Angeles', 'TeamName': 'Lakers', 'Conference': 'West',
+         'Division': 'Pacific', 'PlayoffRank': 1, 'Record': '6-4', 'HOME': '3-2', 'ROAD': '3-2', 'L10': '6-4',
+         'ConferenceRecord': '3-2', 'DivisionRecord': '0-0', 'vsEast': '3-2', 'vsWest': '3-2', 'vsAtlantic': '1-1',
+         'vsSoutheast': '2-1', 'vsPacific': '0-0', 'vsNorthwest': '3-2', 'Mar': '6-4', 'Jul': '', 'PreAS': '6-4',
+         'PostAS': '0-0', 'strCurrentStreak': 'W 1'},
+        {'TeamID': DEN, 'TeamCity': 'Denver', 'TeamName': 'Nuggets', 'Conference': 'West',
+         'Division': 'Northwest', 'PlayoffRank': 2, 'Record': '3-7', 'HOME': '2-3', 'ROAD': '1-4', 'L10': '3-7',
+         'ConferenceRecord': '2-3', 'DivisionRecord': '0-0', 'vsEast': '1-4', 'vsWest': '2-3', 'vsAtlantic': '0-2',
+         'vsSoutheast': '1-2', 'vsPacific': '2-3', 'vsNorthwest': '0-0', 'Mar': '3-7', 'Jul': '', 'PreAS': '3-7',
+         'PostAS': '0-0', 'strCurrentStreak': 'L 2'},
+    ])
+
+
+def final(home, home_score, away, away_score, before, date='2024-03-05T19:30:00Z'):
+    """A finished scoreboard game; ``before`` maps team id -> (wins, losses) before it."""
+    def side(team, score, opponent_score):
+        wins, losses = before[team]
+        won = score > opponent_score
+        return {'teamId': team, 'score': score, 'wins': wins + won, 'losses': losses + (not won)}
+
+    return {'gameStatus': 3, 'gameEt': date,
+            'homeTeam': side(home, home_score, away_score), 'awayTeam': side(away, away_score, home_score)}
+
+
+def row(df, team):
+    return df.set_index('TeamID').loc[team]
+
+
+def test_season_record_comes_from_record_column():
+    raw = raw_standings()
+    # A bubble-style month outside Oct-May still counts towards the season
+    raw.loc[raw['TeamID'] == ATL, ['Record', 'Jul']] = ['6-6', '2-0']
+    df = standings.parse_standings(raw)
+    assert (row(df, ATL)['WINS'], row(df, ATL)['LOSSES']) == (6, 6)
+    assert row(df, ATL)['Jul_W'] == 2
+    assert row(df, ATL)['Division'] == 'Southeast'
+
+
+def test_apply_game_results_updates_splits():
+    df = standings.parse_standings(raw_standings())
+    # Boston beats Atlanta by 2 at home; an East-only game in March
+    games = [final(BOS, 101, ATL, 99, {BOS: (7, 3), ATL: (4, 6)})]
+    out = standings.apply_game_results(df, games)
+
+    boston, atlanta = row(out, BOS), row(out, ATL)
+    assert (boston['WINS'], boston['LOSSES'], boston['Streak']) == (8, 3, 4)
+    assert (atlanta['WINS'], atlanta['LOSSES'], atlanta['Streak']) == (4, 7, -2)
+    assert (boston['HOME_W'], boston['ROAD_W']) == (5, 3)
+    assert (atlanta['HOME_L'], atlanta['ROAD_L']) == (3, 4)
+    assert (boston['ConferenceRecord_W'], atlanta['ConferenceRecord_L']) == (5, 4)
+    assert (boston['vsSoutheast_W'], atlanta['vsAtlantic_L']) == (3, 3)
+    assert (boston['Mar_W'], atlanta['Mar_L']) == (8, 7)
+    # Different divisions: division records are untouched
+    assert (boston['DivisionRecord_W'], atlanta['DivisionRecord_L']) == (2, 1)
+
+    # The split columns still add up to the season record
+    for team in (boston, atlanta):
+        for suffix in ('W', 'L'):
+            assert team[f'vsEast_{suffix}'] + team[f'vsWest_{suffix}'] == team[f'Record_{suffix}']
+            assert team[f'HOME_{suffix}'] + team[f'ROAD_{suffix}'] == team[f'Record_{suffix}']
+
+    # Splits the scoreboard can't place are unknown for the teams that played only
+    assert pd.isna(boston['PreAS_W']) and pd.isna(atlanta['L10_L']) and pd.isna(boston['L10'])
+    assert row(out, LAL)['PreAS_W'] == 6 and row(out, LAL)['L10'] == '6-4'
+
+
+def test_apply_game_results_division_game():
+    df = standings.parse_standings(raw_standings())
+    df.loc[df['TeamID'] == ATL, 'Division'] = 'Atlantic'
+    out = standings.apply_game_results(df, [final(ATL, 110, BOS, 95, {ATL: (4, 6), BOS: (7, 3)})])
+    assert row(out, ATL)['DivisionRecord_W'] == 2 and row(out, BOS)['DivisionRecord_L'] == 1
+    assert row(out, ATL)['vsAtlantic_W'] == 3
+
+
+def test_apply_game_results_twice_is_a_no_op():
+    df = standings.parse_standings(raw_standings())
+    games = [
+        final(BOS, 101, ATL, 99, {BOS: (7, 3), ATL: (4, 6)}),
+        final(DEN, 120, LAL, 104, {DEN: (3, 7), LAL: (6, 4)}),
+        # Still in progress: never applied
+        {**final(ATL, 50, LAL, 40, {ATL: (4, 6), LAL: (6, 4)}), 'gameStatus': 2},
+    ]
+    once = standings.apply_game_results(df, games)
+    twice = standings.apply_game_results(once, games)
+    pd.testing.assert_frame_equal(once, twice)
+    assert (once['WINS'] + once['LOSSES']).tolist() == [11, 11, 11, 11]
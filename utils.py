@@ -1,34 +1,140 @@
+import threading
+from collections import Counter
+
 import streamlit as st
-import pandas as pd
-from nba_api.stats.endpoints import leagueleaders
-from nba_api.stats.static import teams, players
 
-@st.cache_data
+import nba_data
+import playoffs
+import shared_store
+import standings
+
+# The uncached loaders live in nba_data (shared with the batch CLI); this
+# module adds the app's cache layer on top of them.
+
+# Every cached loader takes a ``generation`` argument. Readers always ask for
+# the published generation; the background warmer (see cache_warmer.py) fills
+# the next one ahead of time and only then publishes it, so a user request
+# never waits on a refresh once the warmer is running.
+_generations = {}
+_access_counts = Counter()
+_generation_lock = threading.Lock()
+
+def current_generation(key):
+    """Return the published generation for ``key`` and count the access."""
+    with _generation_lock:
+        _access_counts[key] += 1
+        return _generations.get(key, 0)
+
+def peek_generation(key):
+    """Return the published generation for ``key`` without counting an access."""
+    with _generation_lock:
+        return _generations.get(key, 0)
+
+def publish_generation(key, generation):
+    with _generation_lock:
+        _generations[key] = generation
+
+def access_counts():
+    with _generation_lock:
+        return dict(_access_counts)
+
+# When NBA_SHARED_CACHE_DIR is set, the season and standings frames come from
+# memory-mapped Arrow files shared by every replica on the host instead of
+# from this process's st.cache_data (see shared_store.py).
+SHARED_STORE = shared_store.from_env()
+STANDINGS_MAX_AGE = 3600
+# Only the season in progress changes; past seasons never go stale
+LEADERS_MAX_AGE = 3600
+
 def fetch_nba_data(season):
-    # Get league leaders data
-    league_leaders = leagueleaders.LeagueLeaders(season=season)
-    df = league_leaders.get_data_frames()[0]
-    
-    # Get players data for names if needed
-    players_df = pd.DataFrame(players.get_players())
-    
-    # Merge only if you need additional player information
-    df = df.merge(
-        players_df[['id', 'full_name']],
-        left_on='PLAYER_ID',
-        right_on='id',
-        how='left'
-    )
-    
-    return df
+    key = f"leaders:{season}"
+    current = season == nba_data.current_season()
+    if SHARED_STORE is not None:
+        return SHARED_STORE.load(key, download_nba_data, season, max_age=LEADERS_MAX_AGE if current else None)
+    if current:
+        return _fetch_nba_data(season, current_generation(key))
+    return _fetch_past_nba_data(season)
+
+# Only the current season is re-warmed. The TTL outlasts the warm interval a
+# little, so the generation the warmer replaces expires soon after instead of
+# sitting in the cache until LRU eviction.
+@st.cache_data(ttl=LEADERS_MAX_AGE + 600, max_entries=4)
+def _fetch_nba_data(season, generation):
+    return download_nba_data(season)
+
+# Finished seasons and All Time are loaded once and kept
+@st.cache_data(max_entries=50)
+def _fetch_past_nba_data(season):
+    return download_nba_data(season)
+
+def download_nba_data(season):
+    return nba_data.download_nba_data(season, _fetch_players(peek_generation("players")))
 
-@st.cache_data
 def fetch_teams():
-    return pd.DataFrame(teams.get_teams())
+    return _fetch_teams(current_generation("teams"))
+
+@st.cache_data(max_entries=2)
+def _fetch_teams(generation):
+    return nba_data.download_teams()
 
-@st.cache_data
 def fetch_players():
-    return pd.DataFrame(players.get_players())
+    return _fetch_players(current_generation("players"))
+
+@st.cache_data(max_entries=2)
+def _fetch_players(generation):
+    return nba_data.download_players()
+
+def get_current_standings():
+    generation = current_generation("standings")
+    if SHARED_STORE is not None:
+        df = SHARED_STORE.load("standings", nba_data.download_current_standings, max_age=STANDINGS_MAX_AGE)
+    else:
+        df = _load_current_standings(generation)
+    # Fold in games that finished since the standings were cached, from the
+    # last scoreboard fetched off the request path (never fetched here)
+    return standings.apply_game_results(df, latest_scoreboard())
+
+# The TTL is a backstop for when the warmer isn't running
+@st.cache_data(ttl=STANDINGS_MAX_AGE)  # Cache for 1 hour
+def _load_current_standings(generation):
+    return nba_data.download_current_standings()
+
+# team_id and current_losses only key the cache: one grid per team per
+# standings snapshot, so slider moves on the playoff page are lookups
+@st.cache_data(max_entries=64)
+def get_odds_scenarios(team_id, current_wins, current_losses, remaining_games):
+    return playoffs.playoff_odds_grid(current_wins, remaining_games)
+
+# Live scores change by the minute, so this only absorbs bursts of reruns
+@st.cache_data(ttl=30)
+def get_live_scoreboard():
+    return refresh_scoreboard()
+
+# Last scoreboard fetched successfully, by the warmer or the live games page
+_latest_scoreboard = []
+
+def latest_scoreboard():
+    return _latest_scoreboard
+
+def refresh_scoreboard(generation=None):
+    """Fetch the live scoreboard and keep it as the latest good copy."""
+    global _latest_scoreboard
+    games = nba_data.download_scoreboard()
+    _latest_scoreboard = games
+    return games
+
+def start_background_services():
+    """Start the process-wide cache warmer and (if configured) the JSON API.
+
+    Every page calls this once; both are st.cache_resource singletons, so
+    only the first call in the server process starts anything.
+    """
+    # Imported here because both modules import utils
+    from api_server import start_api_server
+    from cache_warmer import start_cache_warmer
+
+    start_cache_warmer()
+    start_api_server()
 
 def render_footer():
     st.markdown(
@@ -48,4 +154,4 @@ def render_footer():
         <div class="footer">Data sourced from NBA API | Built with ❤️ using Streamlit</div>
         """,
         unsafe_allow_html=True
-    )
\ No newline at end of file
+    )